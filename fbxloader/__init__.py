@@ -255,7 +255,15 @@ def parse_binary_fbx(data):
 
 
 class FBXLoader:
-    def __init__(self, path_or_blob: Optional[Union[str, bytes]]):
+    def __init__(self, path_or_blob: Optional[Union[str, bytes]], dtype: Union[str, type, np.dtype] = np.float64):
+
+        ### precision of the geometry held on the scene's Mesh objects
+        # float32 also stores faces as int32, halving the memory of Mesh.vertices and Mesh.faces.
+        # vertices are pre-transformed in float64 and downcast only once, when the Mesh is built.
+        # export_trimesh always returns a float64/int64 mesh, since trimesh upcasts anyway.
+        self.dtype = np.dtype(dtype)
+        assert self.dtype in (np.float32, np.float64), f'Unsupported dtype {self.dtype}, must be float32 or float64'
+        self.index_dtype = np.dtype(np.int32) if self.dtype == np.float32 else np.dtype(np.int64)
 
         ### parse binary fbx into tree
         if isinstance(path_or_blob, str):
@@ -363,12 +371,12 @@ class FBXLoader:
                 vertexPositions = node['Vertices']['a'] # list of floats
                 vertexIndices = node['PolygonVertexIndex']['a'] # list of ints, negative means end of polygon
 
-                vertices = np.array(vertexPositions).reshape(-1, 3)
+                vertices = np.array(vertexPositions, dtype=np.float64).reshape(-1, 3)
 
-                # apply preTransform
+                # apply preTransform (in float64, the only downcast to self.dtype happens here)
                 vertices = np.hstack([vertices, np.ones((vertices.shape[0], 1))]).T
                 vertices = preTransform @ vertices
-                vertices = vertices[:3].T
+                vertices = vertices[:3].T.astype(self.dtype)
 
                 faces = []
 
@@ -388,7 +396,7 @@ class FBXLoader:
                     else:
                         cur_face.append(vertexIndex)
                 
-                faces = np.array(faces)
+                faces = np.array(faces, dtype=self.index_dtype).reshape(-1, 3)
 
                 mesh = Mesh(nodeID, vertices, faces)
 
@@ -449,13 +457,14 @@ class FBXLoader:
     
     def export_trimesh(self):
         # export Scene to a signle trimesh.Trimesh
+        # NOTE: trimesh always stores float64 vertices and int64 faces, regardless of self.dtype
 
         submeshes = []
 
         def extract(node):
             if isinstance(node, Mesh):
                 # apply transformation
-                vertices = np.hstack([node.vertices, np.ones((node.vertices.shape[0], 1))]).T
+                vertices = np.hstack([node.vertices.astype(np.float64), np.ones((node.vertices.shape[0], 1))]).T
                 vertices = node.matrixWorld @ vertices
                 vertices = vertices[:3].T
                 # create Trimesh
@@ -0,0 +1,41 @@
+import sys
+sys.path.append('.')
+
+import numpy as np
+import pytest
+from fbxloader import FBXLoader
+from fbxloader.nodes import Mesh
+
+FILE = 'examples/annulus.fbx'
+
+def get_meshes(fbx):
+    meshes = []
+    fbx.scene.traverse(lambda node: meshes.append(node) if isinstance(node, Mesh) else None)
+    return meshes
+
+def test_default_dtype():
+    meshes = get_meshes(FBXLoader(FILE))
+    assert len(meshes) > 0
+    for mesh in meshes:
+        assert mesh.vertices.dtype == np.float64
+        assert mesh.faces.dtype == np.int64
+
+def test_float32_dtype():
+    meshes32 = get_meshes(FBXLoader(FILE, dtype='float32'))
+    meshes64 = get_meshes(FBXLoader(FILE))
+    assert len(meshes32) == len(meshes64)
+    for mesh32, mesh64 in zip(meshes32, meshes64):
+        assert mesh32.vertices.dtype == np.float32
+        assert mesh32.faces.dtype == np.int32
+        np.testing.assert_allclose(mesh32.vertices, mesh64.vertices, rtol=1e-5, atol=1e-5 * np.abs(mesh64.vertices).max())
+        np.testing.assert_array_equal(mesh32.faces, mesh64.faces)
+
+def test_float32_export():
+    mesh32 = FBXLoader(FILE, dtype='float32').export_trimesh()
+    mesh64 = FBXLoader(FILE).export_trimesh()
+    assert mesh32.vertices.dtype == np.float64
+    np.testing.assert_allclose(mesh32.vertices, mesh64.vertices, rtol=1e-5, atol=1e-5 * np.abs(mesh64.vertices).max())
+
+def test_unsupported_dtype():
+    with pytest.raises(AssertionError):
+        FBXLoader(FILE, dtype='float16')